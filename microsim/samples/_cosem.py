@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import json
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Union
 from urllib.request import urlopen
 
-from fibsem_tools import io
 from typing_extensions import TypedDict
 
 try:
@@ -18,14 +19,34 @@ except ImportError:
 
 if TYPE_CHECKING:
     import numpy as np
+    import requests
     import xarray as xr
 
-with open(Path(__file__).parent / "organelles.json") as fh:
-    ORGANELLES = json.load(fh)
-
-ORGANELLE_KEY = {x["file_name"]: x["full_name"] for x in ORGANELLES}
 GH_API = "https://raw.githubusercontent.com/janelia-cosem/fibsem-metadata/stable/api"
 COSEM_S3 = "s3://janelia-cosem-datasets"
+# opt-in local copy of fetched n5 blocks (see `_read_n5`); disabled by default
+_cache_env = os.environ.get("MICROSIM_COSEM_CACHE")
+CACHE_DIR: Optional[Path] = Path(_cache_env).expanduser() if _cache_env else None
+
+
+@lru_cache(maxsize=None)
+def _organelles() -> List[dict]:
+    with open(Path(__file__).parent / "organelles.json") as fh:
+        return json.load(fh)
+
+
+@lru_cache(maxsize=None)
+def _organelle_key() -> Dict[str, str]:
+    return {x["file_name"]: x["full_name"] for x in _organelles()}
+
+
+def __getattr__(name: str) -> Any:
+    # ORGANELLES and ORGANELLE_KEY are loaded lazily, on first access
+    if name == "ORGANELLES":
+        return _organelles()
+    if name == "ORGANELLE_KEY":
+        return _organelle_key()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class DatasetMetadata(TypedDict):
@@ -78,9 +99,6 @@ class CosemDataset:
     def __init__(self, id: str) -> None:
         self.id = id
 
-    def read_xarray(self):
-        io.read_xarray()
-
     @property
     def name(self) -> str:
         return self.manifest["name"]
@@ -98,11 +116,11 @@ class CosemDataset:
             f"views: {len(self.views)}>"
         )
 
-    @property
+    @cached_property
     def manifest(self) -> DatasetManifest:
         return get_manifest(self.id)
 
-    @property
+    @cached_property
     def metadata(self) -> DatasetMetadata:
         return self.manifest["metadata"]
 
@@ -114,7 +132,7 @@ class CosemDataset:
     def views(self) -> List[DatasetView]:
         return self.manifest["views"]
 
-    @property
+    @cached_property
     def sources(self) -> Dict[str, Source]:
         return self.manifest["sources"]
 
@@ -125,9 +143,7 @@ class CosemDataset:
                 f"Can only read n5 sources, (not {source['format']!r})"
             )
 
-        return io.read_xarray(
-            f"{source['url']}/s{level}", storage_options={"anon": True}
-        )
+        return _read_n5(f"{source['url']}/s{level}")
 
     def view(self, name: str) -> DatasetView:
         for d in self.views:
@@ -155,14 +171,37 @@ class CosemDataset:
         )
 
 
-@lru_cache
+@lru_cache(maxsize=None)
+def _session() -> Optional[requests.Session]:
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+    except ImportError:
+        return None
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return session
+
+
+def _fetch(url: str) -> bytes:
+    """Fetch `url`, reusing a keep-alive connection if `requests` is available."""
+    session = _session()
+    if session is not None:
+        r = session.get(url)
+        r.raise_for_status()
+        return r.content
+    with urlopen(url) as r:
+        return r.read()
+
+
+@lru_cache(maxsize=None)
 def get_datasets() -> Dict[str, str]:
     """Retrieve available datasets from janelia-cosem/fibsem-metadata"""
-    with urlopen(f"{GH_API}/index.json") as r:
-        return json.load(r).get("datasets")
+    return json.loads(_fetch(f"{GH_API}/index.json")).get("datasets")
 
 
-@lru_cache(maxsize=64)
+@lru_cache(maxsize=None)
 def get_manifest(dataset: str) -> DatasetManifest:
     """Get manifest for a dataset
 
@@ -179,15 +218,48 @@ def get_manifest(dataset: str) -> DatasetManifest:
         * views: a curated list of views with:
 
     """
-    with urlopen(f"{GH_API}/{dataset}/manifest.json") as r:
-        return json.load(r)
+    return json.loads(_fetch(f"{GH_API}/{dataset}/manifest.json"))
 
 
-@lru_cache(maxsize=64)
+@lru_cache(maxsize=None)
 def get_thumbnail(dataset: str) -> np.ndarray:
-    import imageio
+    return _decode_jpeg(_fetch(f"{GH_API}/{dataset}/thumbnail.jpg"))
+
+
+@lru_cache(maxsize=None)
+def _turbojpeg() -> Optional[Any]:
+    try:
+        from turbojpeg import TurboJPEG
+
+        return TurboJPEG()
+    except (ImportError, OSError, RuntimeError):  # package or libturbojpeg missing
+        return None
+
+
+def _decode_jpeg(data: bytes) -> np.ndarray:
+    """Decode JPEG bytes in their native mode, using libjpeg-turbo if available.
+
+    Grayscale images decode to (H, W), color images to (H, W, 3).
+    """
+    import numpy as np
+
+    tj = _turbojpeg()
+    if tj is not None:
+        import turbojpeg
+
+        colorspace = tj.decode_header(data)[3]
+        if colorspace == turbojpeg.TJCS_GRAY:
+            return tj.decode(data, pixel_format=turbojpeg.TJPF_GRAY)[..., 0]
+        if colorspace in (turbojpeg.TJCS_RGB, turbojpeg.TJCS_YCbCr):
+            return tj.decode(data, pixel_format=turbojpeg.TJPF_RGB)
+        # anything else (e.g. CMYK) is left to Pillow
 
-    return imageio.imread(f"{GH_API}/{dataset}/thumbnail.jpg")
+    from io import BytesIO
+
+    from PIL import Image
+
+    with Image.open(BytesIO(data)) as img:
+        return np.asarray(img)
 
 
 def load_view(
@@ -200,6 +272,7 @@ def load_view(
     level=0,
 ):
     import dask
+    import dask.array as da
     import xarray as xr
 
     ds = CosemDataset(dataset) if isinstance(dataset, str) else dataset
@@ -209,38 +282,75 @@ def load_view(
         if not sources:
             sources = view["sources"]
 
+    src_map = ds.sources
     sources = [
         s.replace("fibsem-uint8", "fibsem-uint16")
         for s in sources
-        if ds.sources.get(s, {}).get("contentType") not in exclude  # type: ignore
+        if src_map.get(s, {}).get("contentType") not in exclude  # type: ignore
     ]
-    _loaded: List[str] = []
-    arrs: List[xr.DataArray] = []
-    for source in sources:
+
+    def _read(source: str) -> Optional[xr.DataArray]:
         try:
-            arrs.append(ds.read_source(source, level))
-            _loaded.append(source)
+            return ds.read_source(source, level)
         except (NotImplementedError, KeyError):
+            return None
+
+    # opening a remote source is dominated by metadata round-trips,
+    # so open them concurrently.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        opened = list(pool.map(_read, sources))
+
+    _loaded: List[str] = []
+    arrs: List[xr.DataArray] = []
+    for source, ary in zip(sources, opened):
+        if ary is None:
             warnings.warn(f"Could not load source {source!r}")
+            continue
+        # crop each source before stacking, so that the concatenated graph
+        # only spans the chunks that intersect the requested region
+        if extent is not None:
+            if position is None:
+                position = [ary.sizes[i] / 2 for i in "xyz"]
+            ary = _crop_around(ary, position, extent)
+        arrs.append(ary)
+        _loaded.append(source)
 
     assert arrs, "Nothing loaded!"
 
     if len(arrs) > 1:
-        with dask.config.set(**{"array.slicing.split_large_chunks": False}):
-            stack = xr.concat(arrs, dim="source")
-        stack.coords["source"] = _loaded
+        first = arrs[0]
+        if all(_same_grid(a, first) for a in arrs[1:]):
+            # sources share dims and coords: stack the dask arrays directly and
+            # skip xr.concat's alignment/index-building machinery
+            stack = xr.DataArray(
+                da.stack([a.data for a in arrs]),
+                dims=("source", *first.dims),
+                coords={**first.coords, "source": _loaded},
+                attrs=first.attrs,
+            )
+            # set after construction: with name=None, xarray would take the
+            # dask array's name
+            stack.name = first.name
+        else:
+            with dask.config.set(**{"array.slicing.split_large_chunks": False}):
+                stack = xr.concat(arrs, dim="source")
+            stack.coords["source"] = _loaded
     else:
         stack = arrs[0]
 
-    if extent is not None:
-        if position is None:
-            position = [stack.sizes[i] / 2 for i in "xyz"]
-        stack = _crop_around(stack, position, extent)
-
     # .transpose("source", "y", "z", "x")
     return stack
 
 
+def _same_grid(a: xr.DataArray, b: xr.DataArray) -> bool:
+    """Return True if `a` and `b` have the same dims and identical coordinates.
+
+    Non-index coordinates are compared too, since xr.concat would stack any
+    that differ along the new dimension.
+    """
+    return a.dims == b.dims and a.coords.to_dataset().identical(b.coords.to_dataset())
+
+
 def _crop_around(
     ary: xr.DataArray,
     position: Sequence[float],
@@ -248,18 +358,66 @@ def _crop_around(
     axes="xyz",
 ):
     """crop dataarray around position"""
+    import numpy as np
+
     assert len(position) == 3, "position must be of length 3 (X, Y, Z)"
-    if isinstance(extent, (float, int)):
-        extent = (extent,) * 3
-    assert len(extent) == 3, "extent must be of length 3"
+    half = np.asarray(extent, dtype=float) / 2
+    if half.ndim == 0:
+        half = np.repeat(half, 3)
+    assert half.shape == (3,), "extent must be of length 3"
+
+    center = np.asarray(position, dtype=float)
+    starts, stops = (center - half).tolist(), (center + half).tolist()
+
+    # on sorted coordinates, resolve the label slices to integer positions
+    # ourselves and use .isel, skipping xarray's label-based indexing
+    islc = {}
+    for ax, start, stop in zip(axes, starts, stops):
+        idx = ary.indexes.get(ax)
+        if idx is None or not idx.is_monotonic_increasing:
+            return ary.sel({k: slice(a, b) for k, a, b in zip(axes, starts, stops)})
+        coord = np.asarray(idx)
+        islc[ax] = slice(
+            int(np.searchsorted(coord, start, "left")),
+            int(np.searchsorted(coord, stop, "right")),
+        )
+    return ary.isel(islc)
+
 
-    slc = {ax: slice(p - e / 2, p + e / 2) for p, e, ax in zip(position, extent, axes)}
-    return ary.sel(**slc)
+def read_dataset(dataset: str, source: str, level: int = 0) -> xr.DataArray:
+    return _read_n5(f"{COSEM_S3}/{dataset}/{dataset}.n5/{source}/s{level}")
 
 
-def read_dataset(dataset: str, source: str, level: int = 0) -> xr.Dataset:
-    uri = f"{COSEM_S3}/{dataset}/{dataset}.n5/{source}/s{level}"
-    return io.read_xarray(uri, storage_options={"anon": True})
+def _read_n5(uri: str) -> xr.DataArray:
+    """Open a (public, anonymous) COSEM n5 array as a lazy DataArray.
+
+    N5 has no equivalent of zarr's consolidated `.zmetadata`, so each open
+    costs a GET for the array `attributes.json` (plus the parent group's, for
+    coordinate inference).  All remote opens go through here so that storage
+    options are tuned in one place.
+
+    Dask chunks match the native n5 chunks, so each task maps to exactly one
+    stored block and cropped reads don't fetch neighboring blocks.  Callers
+    wanting coarser tasks can ``.chunk()`` afterwards, but note that this
+    doesn't change which blocks are fetched from the store.
+
+    Local caching is opt-in: set `CACHE_DIR` (or the `MICROSIM_COSEM_CACHE`
+    environment variable) to a directory, and s3 reads go through fsspec's
+    `simplecache`, so blocks that have been fetched once are read from local
+    disk afterwards.  The cache has no size limit and is never invalidated:
+    reading a full-resolution source copies the whole source to disk, and
+    the directory must be cleared by hand (e.g. if a dataset is updated).
+    """
+    storage_options: Dict[str, Any] = {"anon": True}
+    if CACHE_DIR is not None and uri.startswith("s3://"):
+        uri = f"simplecache::{uri}"
+        storage_options = {
+            "s3": storage_options,
+            "simplecache": {"cache_storage": str(CACHE_DIR)},
+        }
+    from fibsem_tools import io
+
+    return io.read_xarray(uri, chunks="original", storage_options=storage_options)
 
 
 SAMPLES = {
@@ -280,15 +438,24 @@ jrc_hela_2_roi = {
 }
 
 
-def _load_local(dataset, sources, slices=None, b=4):
+def _load_local(dataset, sources, slices=None, b=4, chunks=None):
+    """Load binned sources saved by `download_cosem`, stacked as (C, Y, Z, X).
+
+    `chunks` are dask chunks for each source, given in the output spatial order
+    (Y, Z, X).  They are applied when the arrays are opened (rechunking
+    afterwards does not change which stored blocks are read), so pick them to
+    match the access pattern.  By default, the native zarr chunks are used.
+    """
     import dask.array as da
     import zarr.convenience
 
     _dir = Path(__file__).parent.parent.parent
-    zas = [
-        zarr.convenience.open_array(_dir / f"{dataset}" / f"{source}_b{b}.zarr")
-        for source in sources
-    ]
+    zas = []
+    for source in sources:
+        z = zarr.convenience.open_array(_dir / f"{dataset}" / f"{source}_b{b}.zarr")
+        # the final transpose swaps the first two spatial axes of the stored array
+        _chunks = z.chunks if chunks is None else (chunks[1], chunks[0], chunks[2])
+        zas.append(da.from_array(z, chunks=_chunks))
     za = da.stack(zas)
     if slices := (slice(None),) + slices:
         za = za[slices]
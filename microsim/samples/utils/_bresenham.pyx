@@ -4,6 +4,8 @@
 cimport cython
 from libc.math cimport abs, sqrt
 
+import numpy as np
+
 
 @cython.boundscheck(False)  # Deactivate bounds checking
 @cython.wraparound(False)   # Deactivate negative indexing.
@@ -12,7 +14,8 @@ cdef int bres_draw_segment_2d(int[:] coord, int[:, :] grid, float max_r):
 
     See http://en.wikipedia.org/wiki/Bresenham%27s_line_algorithm
     """
-    cdef int x0, y0, x1, y1, dx, dy, sx, sy, err, e2
+    cdef int x0, y0, x1, y1, dx, dy, sx, sy, err, e2, m
+    cdef double yr, xr
 
     y0 = coord[0]
     x0 = coord[1]
@@ -35,13 +38,15 @@ cdef int bres_draw_segment_2d(int[:] coord, int[:, :] grid, float max_r):
         if x0 == x1 and y0 == y1:
             break
 
+        # branchless error-term update: m is all ones if the step is taken,
+        # else zero (the branches are ~50% taken with no pattern)
         e2 = 2 * err
-        if e2 >= dy:
-            err += dy
-            x0 += sx
-        if e2 <= dx:
-            err += dx
-            y0 += sy
+        m = -<int>(e2 >= dy)
+        err += dy & m
+        x0 += sx & m
+        m = -<int>(e2 <= dx)
+        err += dx & m
+        y0 += sy & m
 
     return 0
 
@@ -53,8 +58,9 @@ cdef int bres_draw_segment_3d(int[:] coord, int[:, :, :] grid, float max_r):
 
     See http://en.wikipedia.org/wiki/Bresenham%27s_line_algorithm
     """
-    cdef int x0, y0, z0, x1, y1, z1, dx, dy, dz, sx, sy, sz, dm, i
+    cdef int x0, y0, z0, x1, y1, z1, dx, dy, dz, sx, sy, sz, dm, i, m
     cdef float zr, yr, xr
+    cdef double r
 
     z0 = coord[0]
     y0 = coord[1]
@@ -72,7 +78,7 @@ cdef int bres_draw_segment_3d(int[:] coord, int[:, :, :] grid, float max_r):
 
     dm = max(dx, dy, dz)
     i = dm
-    x1 = y1 = z1 = dm/2
+    x1 = y1 = z1 = dm // 2
 
     zr = grid.shape[0] / 2
     yr = grid.shape[1] / 2
@@ -85,29 +91,49 @@ cdef int bres_draw_segment_3d(int[:] coord, int[:, :, :] grid, float max_r):
         if i == 0:
             break
 
+        # branchless error-term update, as in the 2D case
         x1 -= dx
-        if (x1 < 0):
-            x1 += dm
-            x0 += sx
+        m = -<int>(x1 < 0)
+        x1 += dm & m
+        x0 += sx & m
         y1 -= dy
-        if (y1 < 0):
-            y1 += dm
-            y0 += sy
+        m = -<int>(y1 < 0)
+        y1 += dm & m
+        y0 += sy & m
         z1 -= dz
-        if (z1 < 0):
-            z1 += dm
-            z0 += sz
+        m = -<int>(z1 < 0)
+        z1 += dm & m
+        z0 += sz & m
         i -= 1
 
     return 0
 
 
 def drawlines_bresenham(segments, grid, max_r=2):
+    cdef int[:, :] segs
+    cdef int[:, :] grid2d
+    cdef int[:, :, :] grid3d
+    cdef float r = max_r
+    cdef Py_ssize_t n
+    # accept any sequence of segments (e.g. a list of 1D arrays), not just 2D arrays
+    segments = np.asarray(segments)
+    if segments.size == 0:
+        segments = np.empty((0, 2 * grid.ndim), dtype=np.int32)
+    elif segments.dtype != np.int32:
+        if not np.issubdtype(segments.dtype, np.integer):
+            raise TypeError(f'segments must be integers.  Got {segments.dtype}')
+        _segments = segments.astype(np.int32)
+        if (_segments != segments).any():
+            raise ValueError('segments contain values outside the int32 range')
+        segments = _segments
+    segs = segments
     if grid.ndim == 2:
-        for segment in segments:
-            bres_draw_segment_2d(segment, grid, max_r)
+        grid2d = grid
+        for n in range(segs.shape[0]):
+            bres_draw_segment_2d(segs[n], grid2d, r)
     elif grid.ndim == 3:
-        for segment in segments:
-            bres_draw_segment_3d(segment, grid, max_r)
+        grid3d = grid
+        for n in range(segs.shape[0]):
+            bres_draw_segment_3d(segs[n], grid3d, r)
     else:
         raise ValueError(f'grid must be either 2 or 3 dimensional.  Got {grid.ndim}')
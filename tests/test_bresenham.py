@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from microsim.samples.utils._bresenham import drawlines_bresenham
 
@@ -26,3 +27,19 @@ def test_bres3():
         expect[i, i, i] = 1
 
     np.testing.assert_array_equal(a, expect)
+
+
+def test_bres_segment_list():
+    n = 100
+    a: np.ndarray = np.zeros((n, n)).astype(np.int32)
+    segments = [np.array([0, 0, n - 1, n - 1], dtype=np.int32)]
+    drawlines_bresenham(segments, a)
+
+    np.testing.assert_array_equal(a, np.eye(n, dtype=np.int32))
+
+
+def test_bres_float_segments_raise():
+    a: np.ndarray = np.zeros((10, 10)).astype(np.int32)
+    with pytest.raises(TypeError):
+        drawlines_bresenham(np.array([[0.7, 0, 9.9, 9]]), a)
+    assert not a.any()
@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+from microsim.samples._cosem import (
+    CosemDataset,
+    _crop_around,
+    _same_grid,
+    load_view,
+)
+from microsim.util import uniformly_spaced_xarray
+
+
+def _sel_crop(ary, position, extent):
+    return ary.sel(
+        {ax: slice(p - e / 2, p + e / 2) for ax, p, e in zip("xyz", position, extent)}
+    )
+
+
+@pytest.mark.parametrize(
+    "position, extent",
+    [
+        ([10, 8, 6], [4, 4, 4]),  # bounds fall exactly on coordinates (inclusive)
+        ([10.5, 7.3, 3.1], [5, 3.2, 2.9]),  # bounds between coordinates
+        ([0, 0, 0], [6, 6, 6]),  # partially outside the array
+        ([100, 8, 6], [4, 4, 4]),  # entirely outside along x
+    ],
+)
+def test_crop_around_matches_sel(position, extent):
+    a = uniformly_spaced_xarray((8, 10, 12), scale=(2, 2, 2), axes="zyx")
+    expect = _sel_crop(a, position, extent)
+    xr.testing.assert_identical(_crop_around(a, position, extent), expect)
+
+
+def test_crop_around_scalar_extent():
+    a = uniformly_spaced_xarray((8, 10, 12), scale=(2, 2, 2), axes="zyx")
+    result = _crop_around(a, [10, 8, 6], 4)
+    xr.testing.assert_identical(result, _sel_crop(a, [10, 8, 6], [4, 4, 4]))
+    assert result.sizes == {"z": 3, "y": 3, "x": 3}
+
+
+def test_crop_around_non_monotonic():
+    a = uniformly_spaced_xarray((8, 10, 12), scale=(2, 2, 2), axes="zyx")
+    # decreasing x coordinate: falls back to .sel
+    b = a.isel(x=slice(None, None, -1))
+    xr.testing.assert_identical(
+        _crop_around(b, [10, 8, 6], [4, 4, 4]), _sel_crop(b, [10, 8, 6], [4, 4, 4])
+    )
+
+
+def test_same_grid():
+    a = uniformly_spaced_xarray((4, 5, 6), axes="zyx")
+    assert _same_grid(a, a.copy())
+    assert not _same_grid(a, a.assign_coords(x=a.coords["x"] + 1))
+    assert not _same_grid(a, a.drop_vars("x"))
+    assert not _same_grid(a.drop_vars("x"), a)
+    assert not _same_grid(a, a.transpose("x", "y", "z"))
+
+
+def _fake_dataset(monkeypatch, arrays):
+    """CosemDataset whose sources are the given in-memory arrays."""
+    ds = CosemDataset("test")
+    ds.sources = {k: {"contentType": "segmentation"} for k in arrays}
+
+    def read_source(self, key, level=0):
+        return arrays[key]
+
+    monkeypatch.setattr(CosemDataset, "read_source", read_source)
+    return ds
+
+
+def _sources(n=3, **coords):
+    shape = (8, 10, 12)
+    return {
+        f"src{i}": uniformly_spaced_xarray(shape, scale=(2, 2, 2), axes="zyx")
+        .copy(data=np.full(shape, i))
+        .assign_coords(**coords)
+        .chunk(4)
+        for i in range(n)
+    }
+
+
+def _concat_reference(arrays, names, position, extent):
+    arrs = [_crop_around(arrays[n], position, extent) for n in names]
+    expect = xr.concat(arrs, dim="source")
+    expect.coords["source"] = names
+    return expect
+
+
+def test_load_view_stacks_sources(monkeypatch):
+    arrays = _sources()
+    ds = _fake_dataset(monkeypatch, arrays)
+    names = ["src2", "src0", "src1"]
+    result = load_view(ds, sources=names, position=[10, 8, 6], extent=4)
+
+    assert result.name is None
+    assert result.sizes == {"source": 3, "z": 3, "y": 3, "x": 3}
+    assert list(result.coords["source"].values) == names
+    xr.testing.assert_identical(
+        result.compute(), _concat_reference(arrays, names, [10, 8, 6], [4] * 3)
+    )
+
+
+def test_load_view_non_index_coord_mismatch(monkeypatch):
+    arrays = _sources()
+    x = arrays["src1"].coords["x"]
+    arrays["src1"] = arrays["src1"].assign_coords(t=("x", x.values + 1))
+    for k in ("src0", "src2"):
+        arrays[k] = arrays[k].assign_coords(t=("x", x.values))
+    ds = _fake_dataset(monkeypatch, arrays)
+    names = list(arrays)
+    result = load_view(ds, sources=names, position=[10, 8, 6], extent=4)
+
+    assert result.coords["t"].dims == ("source", "x")
+    xr.testing.assert_identical(
+        result.compute(), _concat_reference(arrays, names, [10, 8, 6], [4] * 3)
+    )
+
+
+def test_load_view_missing_source_warns(monkeypatch):
+    arrays = _sources(2)
+    ds = _fake_dataset(monkeypatch, arrays)
+    with pytest.warns(UserWarning, match="Could not load source 'nope'"):
+        result = load_view(ds, sources=["src1", "nope", "src0"], extent=4)
+
+    assert list(result.coords["source"].values) == ["src1", "src0"]